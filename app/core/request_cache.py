@@ -0,0 +1,13 @@
+from app.services.settings import thresholds_ctx
+from app.services.trip_context import clear_trip_context
+
+
+async def request_cache_middleware(request, call_next):  # type: ignore
+    """Give each request fresh request-scoped caches (trip, metadata, thresholds)."""
+    clear_trip_context()
+    token = thresholds_ctx.set(None)
+    try:
+        return await call_next(request)
+    finally:
+        thresholds_ctx.reset(token)
+        clear_trip_context()
@@ -10,30 +10,91 @@ Responsibilities
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import sqlite3
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import date
 
 from app.models import ExpenseIn
 from app.models.constants import FOREX_CURRENCIES
 from app.services import app_settings
+from app.db.schema import connect
 
 UTC_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%fZ','now')"
 VALID_TRIP_STATUSES = {"active", "archived"}
 _UNSET = object()
 
+# Expense-insert bookkeeping statements, shared by the per-row and batch paths.
+_ENSURE_BUDGET_SQL = f"""
+    INSERT OR IGNORE INTO budgets (trip_id, currency, max_amount, spent_amount, updated_at)
+    VALUES (?, ?, ?, 0, ({UTC_NOW_SQL}))
+"""
+_INSERT_EXPENSE_SQL = f"""
+    INSERT INTO expenses (
+        trip_id, amount, currency, category, description, date, payment_method,
+        inr_equivalent, exchange_rate, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ({UTC_NOW_SQL}), ({UTC_NOW_SQL}))
+"""
+_ADD_BUDGET_SPENT_SQL = f"""
+    UPDATE budgets
+    SET spent_amount = spent_amount + ?, updated_at = ({UTC_NOW_SQL})
+    WHERE trip_id = ? AND currency = ?
+"""
+_ENSURE_FOREX_CARD_SQL = f"""
+    INSERT OR IGNORE INTO forex_cards (trip_id, currency, loaded_amount, spent_amount, updated_at)
+    VALUES (?, ?, 0, 0, ({UTC_NOW_SQL}))
+"""
+_ADD_FOREX_SPENT_SQL = f"""
+    UPDATE forex_cards
+    SET spent_amount = spent_amount + ?, updated_at = ({UTC_NOW_SQL})
+    WHERE trip_id = ? AND currency = ?
+"""
+
+
+def _expense_params(
+    tid: int, expense: ExpenseIn, inr_equivalent: float, exchange_rate: float
+) -> Tuple[Any, ...]:
+    return (
+        tid,
+        expense.amount,
+        expense.currency,
+        expense.category,
+        expense.description,
+        expense.date.isoformat(),
+        expense.payment_method,
+        inr_equivalent,
+        exchange_rate,
+    )
+
 
 class Database:
+    # Per-path counter bumped after every committed write to trips (or the
+    # default currencies trips fall back to); lets callers cache trip-derived
+    # views and detect staleness without re-querying.
+    _trips_versions: Dict[str, int] = {}
+
     def __init__(self, db_path: Path):
         self.db_path = db_path
 
+    def trips_version(self) -> int:
+        return Database._trips_versions.get(str(self.db_path), 0)
+
+    def _bump_trips_version(self) -> None:
+        key = str(self.db_path)
+        Database._trips_versions[key] = Database._trips_versions.get(key, 0) + 1
+
     # ------------------------------------------------------------------
     # Connection helpers
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # WAL (enabled once in init_db) makes NORMAL durable across crashes
+        # while syncing only at checkpoints instead of every commit.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp b-trees (ORDER BY / GROUP BY spills) off disk.
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
     def _resolve_trip_id(
@@ -116,6 +177,35 @@ class Database:
         with self._connect() as conn:
             return self._resolve_trip_id(None, conn.cursor())
 
+    def get_request_bootstrap(self, keys: Iterable[str] = ()) -> Dict[str, Any]:
+        """Return ``{"trip_id": ..., "metadata": {...}}`` over one connection.
+
+        Reads ``active_trip_id`` plus the requested metadata keys in a single
+        query so request-scoped caches (trip context, thresholds) warm up with
+        one round-trip. ``trip_id`` is None when no trip exists yet.
+        """
+        wanted = ("active_trip_id", *keys)
+        with self._connect() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT key, value FROM metadata WHERE key IN ({})".format(
+                    ",".join("?" * len(wanted))
+                ),
+                wanted,
+            )
+            metadata = {r[0]: r[1] for r in cur.fetchall()}
+            trip_id: Optional[int]
+            try:
+                trip_id = int(metadata["active_trip_id"])
+            except (KeyError, TypeError, ValueError):
+                try:
+                    trip_id = self._resolve_trip_id(None, cur)
+                except RuntimeError:
+                    trip_id = None
+                else:
+                    metadata["active_trip_id"] = str(trip_id)
+            return {"trip_id": trip_id, "metadata": metadata}
+
     def create_trip(
         self,
         name: str,
@@ -153,6 +243,7 @@ class Database:
             if make_active or status == "active":
                 self._set_active_trip(cur, trip_id)
             conn.commit()
+            self._bump_trips_version()
             return trip_id
 
     def get_expense(
@@ -226,6 +317,37 @@ class Database:
                 return None
             return date.fromisoformat(row[0])
 
+    def distinct_expense_dates(
+        self, phase: Optional[str] = None, trip_id: Optional[int] = None
+    ) -> List[date]:
+        """Sorted distinct expense dates, optionally limited to a trip phase.
+
+        Phase follows the /expenses option A semantics: 'pre-trip' is strictly
+        before the trip start (empty when dates are unset), 'trip' is on/after
+        it (everything when dates are unset). Served from idx_expenses_trip_date.
+        """
+        if phase not in (None, "pre-trip", "trip"):
+            raise ValueError("invalid phase value")
+        with self._connect() as conn:
+            cur = conn.cursor()
+            tid = self._resolve_trip_id(trip_id, cur)
+            query = "SELECT DISTINCT date FROM expenses WHERE trip_id = ?"
+            params: List[Any] = [tid]
+            if phase is not None:
+                cur.execute(
+                    "SELECT start_date, end_date FROM trips WHERE id = ?", (tid,)
+                )
+                row = cur.fetchone()
+                start = row[0] if row and row[0] and row[1] else None
+                if start is None:
+                    if phase == "pre-trip":
+                        return []
+                else:
+                    query += " AND date < ?" if phase == "pre-trip" else " AND date >= ?"
+                    params.append(start)
+            cur.execute(query + " ORDER BY date", params)
+            return [date.fromisoformat(r[0]) for r in cur.fetchall()]
+
     def daily_totals(
         self,
         start_date: Optional[date] = None,
@@ -426,6 +548,24 @@ class Database:
             if cur.rowcount == 0:
                 raise ValueError("Trip not found")
             conn.commit()
+            self._bump_trips_version()
+
+    def clear_trip_dates(self, trip_id: Optional[int] = None) -> None:
+        with self._connect() as conn:
+            cur = conn.cursor()
+            tid = self._resolve_trip_id(trip_id, cur)
+            cur.execute(
+                f"""
+                UPDATE trips
+                SET start_date = NULL, end_date = NULL, updated_at = ({UTC_NOW_SQL})
+                WHERE id = ?
+                """,
+                (tid,),
+            )
+            if cur.rowcount == 0:
+                raise ValueError("Trip not found")
+            conn.commit()
+            self._bump_trips_version()
 
     # ------------------------------------------------------------------
     # Forex card helpers (trip scoped)
@@ -524,12 +664,14 @@ class Database:
             if cur.rowcount == 0:
                 raise ValueError("Trip not found")
             conn.commit()
+            self._bump_trips_version()
 
     def set_active_trip(self, trip_id: int) -> None:
         with self._connect() as conn:
             cur = conn.cursor()
             self._set_active_trip(cur, trip_id)
             conn.commit()
+            self._bump_trips_version()
 
     def _set_active_trip(self, cur: sqlite3.Cursor, trip_id: int) -> None:
         cur.execute("SELECT status FROM trips WHERE id = ?", (trip_id,))
@@ -590,42 +732,62 @@ class Database:
                 )
 
             conn.commit()
+            self._bump_trips_version()
 
     # ------------------------------------------------------------------
     # Currency utilities
     def get_default_currencies(self) -> List[str]:
         """Get global default currencies from metadata, or fallback to hardcoded defaults."""
         with self._connect() as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT value FROM metadata WHERE key = 'default_currencies'")
-            row = cur.fetchone()
-            if row and row[0]:
-                try:
-                    return json.loads(row[0])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-        # Fallback to legacy hardcoded defaults
-        return ["INR", "SGD", "MYR"]
+            return self._read_default_currencies(conn.cursor())
 
     def set_default_currencies(self, currencies: List[str]) -> None:
         """Set global default currencies in metadata."""
         if not currencies or len(currencies) == 0:
             raise ValueError("currencies list cannot be empty")
 
-        currencies_json = json.dumps(currencies)
+        with self._connect() as conn:
+            self._write_default_currencies(conn.cursor(), currencies)
+            conn.commit()
+            self._bump_trips_version()
+
+    def swap_default_currencies(self, currencies: List[str]) -> List[str]:
+        """Set global default currencies and return the previous ones (one transaction)."""
+        if not currencies or len(currencies) == 0:
+            raise ValueError("currencies list cannot be empty")
+
         with self._connect() as conn:
             cur = conn.cursor()
-            cur.execute(
-                f"""
-                INSERT INTO metadata (key, value, updated_at)
-                VALUES ('default_currencies', ?, ({UTC_NOW_SQL}))
-                ON CONFLICT(key) DO UPDATE SET
-                    value = excluded.value,
-                    updated_at = ({UTC_NOW_SQL})
-                """,
-                (currencies_json,),
-            )
+            previous = self._read_default_currencies(cur)
+            self._write_default_currencies(cur, currencies)
             conn.commit()
+            self._bump_trips_version()
+            return previous
+
+    def _read_default_currencies(self, cur: sqlite3.Cursor) -> List[str]:
+        cur.execute("SELECT value FROM metadata WHERE key = 'default_currencies'")
+        row = cur.fetchone()
+        if row and row[0]:
+            try:
+                return json.loads(row[0])
+            except (json.JSONDecodeError, TypeError):
+                pass
+        # Fallback to legacy hardcoded defaults
+        return ["INR", "SGD", "MYR"]
+
+    def _write_default_currencies(
+        self, cur: sqlite3.Cursor, currencies: List[str]
+    ) -> None:
+        cur.execute(
+            f"""
+            INSERT INTO metadata (key, value, updated_at)
+            VALUES ('default_currencies', ?, ({UTC_NOW_SQL}))
+            ON CONFLICT(key) DO UPDATE SET
+                value = excluded.value,
+                updated_at = ({UTC_NOW_SQL})
+            """,
+            (json.dumps(currencies),),
+        )
 
     def get_trip_currencies(self, trip_id: Optional[int] = None) -> List[str]:
         """Get currencies for a specific trip, falling back to defaults if not set."""
@@ -642,11 +804,35 @@ class Database:
             # Fallback to global defaults
             return self.get_default_currencies()
 
+    def get_all_trip_currencies(self) -> Dict[int, List[str]]:
+        """Map every trip id to its currencies (defaults where unset) in one pass."""
+        with self._connect() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT id, currencies FROM trips ORDER BY id")
+            rows = cur.fetchall()
+            defaults: Optional[List[str]] = None
+            out: Dict[int, List[str]] = {}
+            for row in rows:
+                if row[1]:
+                    try:
+                        out[int(row[0])] = json.loads(row[1])
+                        continue
+                    except (json.JSONDecodeError, TypeError):
+                        pass
+                if defaults is None:
+                    defaults = self._read_default_currencies(cur)
+                out[int(row[0])] = list(defaults)
+            return out
+
     def get_trip_forex_currencies(self, trip_id: Optional[int] = None) -> List[str]:
         """Get forex currencies for a trip (all currencies except INR)."""
         all_currencies = self.get_trip_currencies(trip_id)
         return [c for c in all_currencies if c != "INR"]
 
+    def has_forex_currencies(self, trip_id: Optional[int] = None) -> bool:
+        """True if the trip has any non-INR currency; stops at the first one."""
+        return any(c != "INR" for c in self.get_trip_currencies(trip_id))
+
     # ------------------------------------------------------------------
     # Expense CRUD
     def insert_expense(
@@ -688,96 +874,160 @@ class Database:
         exchange_rate: float,
         trip_id: Optional[int] = None,
     ) -> int:
+        return self.insert_expenses_with_budget_bulk(
+            [(expense, inr_equivalent, exchange_rate)], trip_id=trip_id
+        )[0]
+
+    def insert_expenses_with_budget_bulk(
+        self,
+        rows: Iterable[Tuple[ExpenseIn, float, float]],
+        trip_id: Optional[int] = None,
+    ) -> List[int]:
+        """Insert ``(expense, inr_equivalent, exchange_rate)`` rows in one transaction.
+
+        Budget/forex bookkeeping matches insert_expense_with_budget; any failure
+        (e.g. budget cap exceeded) rolls back the whole batch. Without cap
+        enforcement, multi-row batches go through executemany per statement.
+        """
+        auto_create = app_settings.get_budget_auto_create(self)
+        defaults = app_settings.get_default_budget_amounts(self) if auto_create else {}
+        enforce_cap = app_settings.get_budget_enforce_cap(self)
         with self._connect() as conn:
+            # Take the write lock up front: the batch reads before it writes,
+            # and upgrading a deferred read lock mid-batch can fail with BUSY.
+            conn.execute("BEGIN IMMEDIATE")
             cur = conn.cursor()
             tid = self._resolve_trip_id(trip_id, cur)
-
-            # Budget existence / auto-create / defaults
-            if app_settings.get_budget_auto_create(self):
-                defaults = app_settings.get_default_budget_amounts(self)
-                default_max = float(defaults.get(expense.currency.upper(), 0.0))
-                cur.execute(
-                    """
-                    INSERT OR IGNORE INTO budgets (trip_id, currency, max_amount, spent_amount, updated_at)
-                    VALUES (?, ?, ?, 0, ({utc_now}))
-                    """.format(utc_now=UTC_NOW_SQL),
-                    (tid, expense.currency, default_max),
-                )
-            else:
-                cur.execute(
-                    "SELECT max_amount, spent_amount FROM budgets WHERE trip_id = ? AND currency = ?",
-                    (tid, expense.currency),
-                )
-                if cur.fetchone() is None:
-                    raise ValueError("Budget row missing and auto-create disabled")
-
-            if app_settings.get_budget_enforce_cap(self):
-                cur.execute(
-                    "SELECT max_amount, spent_amount FROM budgets WHERE trip_id = ? AND currency = ?",
-                    (tid, expense.currency),
-                )
-                brow = cur.fetchone()
-                if brow is not None:
-                    max_amt = float(brow[0] or 0)
-                    spent_amt = float(brow[1] or 0)
-                    if max_amt > 0 and (spent_amt + expense.amount) > max_amt + 1e-9:
-                        raise ValueError("Budget cap exceeded")
-
-            # Insert expense row
-            cur.execute(
-                f"""
-                INSERT INTO expenses (
-                    trip_id, amount, currency, category, description, date, payment_method,
-                    inr_equivalent, exchange_rate, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ({UTC_NOW_SQL}), ({UTC_NOW_SQL}))
-                """,
-                (
+            rows = list(rows)
+            if len(rows) > 1 and auto_create and not enforce_cap:
+                ids = self._insert_expenses_batch(cur, tid, rows, defaults)
+                conn.commit()
+                return ids
+            ids = [
+                self._insert_expense_with_budget(
+                    cur,
                     tid,
-                    expense.amount,
-                    expense.currency,
-                    expense.category,
-                    expense.description,
-                    expense.date.isoformat(),
-                    expense.payment_method,
+                    expense,
                     inr_equivalent,
                     exchange_rate,
-                ),
+                    auto_create=auto_create,
+                    defaults=defaults,
+                    enforce_cap=enforce_cap,
+                )
+                for expense, inr_equivalent, exchange_rate in rows
+            ]
+            conn.commit()
+            return ids
+
+    def _insert_expense_with_budget(
+        self,
+        cur: sqlite3.Cursor,
+        tid: int,
+        expense: ExpenseIn,
+        inr_equivalent: float,
+        exchange_rate: float,
+        *,
+        auto_create: bool,
+        defaults: Dict[str, float],
+        enforce_cap: bool,
+    ) -> int:
+        # Budget existence / auto-create / defaults
+        if auto_create:
+            default_max = float(defaults.get(expense.currency.upper(), 0.0))
+            cur.execute(_ENSURE_BUDGET_SQL, (tid, expense.currency, default_max))
+        else:
+            cur.execute(
+                "SELECT max_amount, spent_amount FROM budgets WHERE trip_id = ? AND currency = ?",
+                (tid, expense.currency),
             )
-            expense_id = int(cur.lastrowid)
+            if cur.fetchone() is None:
+                raise ValueError("Budget row missing and auto-create disabled")
 
-            # Increment budget spent
+        if enforce_cap:
             cur.execute(
-                """
-                UPDATE budgets
-                SET spent_amount = spent_amount + ?, updated_at = ({utc_now})
-                WHERE trip_id = ? AND currency = ?
-                """.format(utc_now=UTC_NOW_SQL),
-                (expense.amount, tid, expense.currency),
+                "SELECT max_amount, spent_amount FROM budgets WHERE trip_id = ? AND currency = ?",
+                (tid, expense.currency),
             )
+            brow = cur.fetchone()
+            if brow is not None:
+                max_amt = float(brow[0] or 0)
+                spent_amt = float(brow[1] or 0)
+                if max_amt > 0 and (spent_amt + expense.amount) > max_amt + 1e-9:
+                    raise ValueError("Budget cap exceeded")
+
+        # Insert expense row
+        cur.execute(
+            _INSERT_EXPENSE_SQL,
+            _expense_params(tid, expense, inr_equivalent, exchange_rate),
+        )
+        expense_id = int(cur.lastrowid)
 
-            # Forex spent tracking
+        # Increment budget spent
+        cur.execute(_ADD_BUDGET_SPENT_SQL, (expense.amount, tid, expense.currency))
+
+        # Forex spent tracking
+        if (
+            expense.payment_method == "forex"
+            and expense.currency in FOREX_CURRENCIES
+        ):
+            cur.execute(_ENSURE_FOREX_CARD_SQL, (tid, expense.currency))
+            cur.execute(_ADD_FOREX_SPENT_SQL, (expense.amount, tid, expense.currency))
+        return expense_id
+
+    def _insert_expenses_batch(
+        self,
+        cur: sqlite3.Cursor,
+        tid: int,
+        rows: List[Tuple[ExpenseIn, float, float]],
+        defaults: Dict[str, float],
+    ) -> List[int]:
+        """Batch path for auto-create without cap checks: one executemany per statement.
+
+        Budget/forex spent increments are summed per currency first, so each
+        budget row is touched once regardless of batch size.
+        """
+        budget_spent: Dict[str, float] = {}
+        forex_spent: Dict[str, float] = {}
+        for expense, _, _ in rows:
+            budget_spent[expense.currency] = (
+                budget_spent.get(expense.currency, 0.0) + expense.amount
+            )
             if (
                 expense.payment_method == "forex"
                 and expense.currency in FOREX_CURRENCIES
             ):
-                cur.execute(
-                    """
-                    INSERT OR IGNORE INTO forex_cards (trip_id, currency, loaded_amount, spent_amount, updated_at)
-                    VALUES (?, ?, 0, 0, ({utc_now}))
-                    """.format(utc_now=UTC_NOW_SQL),
-                    (tid, expense.currency),
+                forex_spent[expense.currency] = (
+                    forex_spent.get(expense.currency, 0.0) + expense.amount
                 )
-                cur.execute(
-                    """
-                    UPDATE forex_cards
-                    SET spent_amount = spent_amount + ?, updated_at = ({utc_now})
-                    WHERE trip_id = ? AND currency = ?
-                    """.format(utc_now=UTC_NOW_SQL),
-                    (expense.amount, tid, expense.currency),
-                )
-
-            conn.commit()
-            return expense_id
+        cur.executemany(
+            _ENSURE_BUDGET_SQL,
+            [
+                (tid, currency, float(defaults.get(currency.upper(), 0.0)))
+                for currency in budget_spent
+            ],
+        )
+        # executemany leaves lastrowid unset; new ids are exactly those above the
+        # prior max (the caller holds the write lock for the whole batch).
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM expenses")
+        prev_max = int(cur.fetchone()[0])
+        cur.executemany(
+            _INSERT_EXPENSE_SQL,
+            [_expense_params(tid, e, inr, rate) for e, inr, rate in rows],
+        )
+        cur.executemany(
+            _ADD_BUDGET_SPENT_SQL,
+            [(amount, tid, currency) for currency, amount in budget_spent.items()],
+        )
+        if forex_spent:
+            cur.executemany(
+                _ENSURE_FOREX_CARD_SQL, [(tid, currency) for currency in forex_spent]
+            )
+            cur.executemany(
+                _ADD_FOREX_SPENT_SQL,
+                [(amount, tid, currency) for currency, amount in forex_spent.items()],
+            )
+        cur.execute("SELECT id FROM expenses WHERE id > ? ORDER BY id", (prev_max,))
+        return [int(r[0]) for r in cur.fetchall()]
 
     def update_budget_delta(
         self, currency: str, delta: float, trip_id: Optional[int] = None
@@ -971,3 +1221,9 @@ class Database:
 
 
 __all__ = ["Database"]
+
+
+@lru_cache
+def get_database(db_path: Path) -> Database:
+    """Shared Database handle per path for routers, services and scripts."""
+    return Database(db_path)
@@ -9,12 +9,12 @@ from __future__ import annotations
 from pathlib import Path
 import sqlite3
 import json
-from typing import Optional
+from typing import Optional, Union
 
 from . import schema as schema_def
-from .schema import init_db
+from .schema import connect, init_schema
 
-CURRENT_SCHEMA_VERSION = 3
+CURRENT_SCHEMA_VERSION = schema_def.SCHEMA_VERSION
 SCHEMA_VERSION_KEY = "schema_version"
 LEGACY_TRIP_META_KEYS = ("trip_start_date", "trip_end_date")
 DEFAULT_CURRENCIES = ["INR", "SGD", "MYR"]
@@ -33,25 +33,48 @@ def _get_schema_version(conn: sqlite3.Connection) -> Optional[int]:
     return None
 
 
-def apply_migrations(db_path: Path) -> int:
-    """Apply required migrations and return resulting schema version."""
-    init_db(db_path)
-    conn = sqlite3.connect(db_path)
+def apply_migrations(db: Union[Path, str, sqlite3.Connection]) -> int:
+    """Apply required migrations and return resulting schema version.
+
+    Accepts a database path (opened and closed here) or an open connection
+    with no transaction in progress (left open for the caller). Schema init
+    and migrations share that single connection.
+    """
+    if isinstance(db, sqlite3.Connection):
+        return _apply_migrations(db)
+    conn = connect(db)
     try:
-        version = _get_schema_version(conn) or 1
-        if version < 2:
-            _migrate_to_v2(conn)
-            version = 2
-        if version < 3:
-            _migrate_to_v3(conn)
-            version = 3
-        _set_schema_version(conn, version)
-        conn.commit()
-        return version
+        return _apply_migrations(conn)
     finally:
         conn.close()
 
 
+def _apply_migrations(conn: sqlite3.Connection) -> int:
+    init_schema(conn)
+    if _get_user_version(conn) >= CURRENT_SCHEMA_VERSION:
+        return CURRENT_SCHEMA_VERSION
+    version = _get_schema_version(conn) or 1
+    if version < 2:
+        _migrate_to_v2(conn)
+        version = 2
+    if version < 3:
+        _migrate_to_v3(conn)
+        version = 3
+    # Versions past the last migration step are DDL/index-only bumps, already
+    # applied by init_schema above.
+    version = max(version, CURRENT_SCHEMA_VERSION)
+    _set_schema_version(conn, version)
+    # Stamped in the file header too: it survives metadata wipes and gives
+    # init_schema / later startups a single-PRAGMA fast path.
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+    conn.commit()
+    return version
+
+
+def _get_user_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
 def _set_schema_version(conn: sqlite3.Connection, version: int) -> None:
     cur = conn.cursor()
     cur.execute(
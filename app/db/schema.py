@@ -16,6 +16,13 @@ from pathlib import Path
 
 BASIC_UTC_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ','now')"
 
+# Schema revision written to PRAGMA user_version by migrate.apply_migrations
+# once the DDL and every migration up to it have been applied. Databases at this
+# version skip DDL_ORDER, INDEX_DDL_ORDER and the WAL pragma in init_schema, so
+# ANY table, column or index change must bump it (test_migration.py pins the
+# DDL against this number and fails when they drift apart).
+SCHEMA_VERSION = 3
+
 TRIPS_DDL = f"""
 CREATE TABLE IF NOT EXISTS trips (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -110,6 +117,35 @@ DDL_ORDER: Sequence[str] = (
     METADATA_DDL,
 )
 
+INDEX_DDL_ORDER: Sequence[str] = (
+    TRIPS_STATUS_INDEX_DDL,
+    BUDGETS_TRIP_INDEX_DDL,
+    FOREX_TRIP_INDEX_DDL,
+    EXPENSES_TRIP_INDEX_DDL,
+    METADATA_ACTIVE_TRIP_INDEX_DDL,
+)
+
+
+# In-memory URI databases vanish when their last connection closes; keep one
+# anchor connection per URI open for the life of the process.
+_MEMORY_ANCHORS: dict[str, sqlite3.Connection] = {}
+
+
+def connect(path: Path | str) -> sqlite3.Connection:
+    """Open a connection, accepting SQLite ``file:`` URIs as well as paths.
+
+    A URI such as ``file:name?mode=memory&cache=shared`` keeps the whole
+    database in RAM and shared across the per-call connections the DAL opens.
+    """
+    target = str(path)
+    if not target.startswith("file:"):
+        return sqlite3.connect(target)
+    if "mode=memory" in target and target not in _MEMORY_ANCHORS:
+        _MEMORY_ANCHORS[target] = sqlite3.connect(
+            target, uri=True, check_same_thread=False
+        )
+    return sqlite3.connect(target, uri=True)
+
 
 def init_db(path: Path) -> None:
     """Create all tables idempotently.
@@ -118,17 +154,31 @@ def init_db(path: Path) -> None:
     ----------
     path: Path to SQLite database file.
     """
-    conn = sqlite3.connect(path)
+    conn = connect(path)
     try:
-        cur = conn.cursor()
+        init_schema(conn)
+    finally:
+        conn.close()
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    """init_db on an already open connection (no transaction in progress); commits.
+
+    Once migrations have stamped ``PRAGMA user_version`` with SCHEMA_VERSION the
+    DDL and index suite is skipped; only the default trip rows are re-checked.
+    """
+    cur = conn.cursor()
+    cur.execute("PRAGMA user_version")
+    if cur.fetchone()[0] < SCHEMA_VERSION:
+        # journal_mode is persisted in the database file, so setting it once
+        # here covers every later connection.
+        conn.execute("PRAGMA journal_mode=WAL")
         for ddl in DDL_ORDER:
             cur.execute(ddl)
-        trip_id = _ensure_default_trip(cur)
-        _ensure_active_trip_metadata(cur, trip_id)
         _ensure_indexes(cur)
-        conn.commit()
-    finally:
-        conn.close()
+    trip_id = _ensure_default_trip(cur)
+    _ensure_active_trip_metadata(cur, trip_id)
+    conn.commit()
 
 
 def _ensure_default_trip(cur: sqlite3.Cursor) -> int:
@@ -166,13 +216,7 @@ def _ensure_active_trip_metadata(cur: sqlite3.Cursor, trip_id: int) -> None:
 
 def _ensure_indexes(cur: sqlite3.Cursor) -> None:
     """Create indexes, tolerating legacy schemas missing scoped columns."""
-    for ddl in (
-        TRIPS_STATUS_INDEX_DDL,
-        BUDGETS_TRIP_INDEX_DDL,
-        FOREX_TRIP_INDEX_DDL,
-        EXPENSES_TRIP_INDEX_DDL,
-        METADATA_ACTIVE_TRIP_INDEX_DDL,
-    ):
+    for ddl in INDEX_DDL_ORDER:
         try:
             cur.execute(ddl)
         except sqlite3.OperationalError:
@@ -4,6 +4,7 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from .core.config import get_settings, Settings
 from .core.logging import init_logging, request_context_middleware
+from .core.request_cache import request_cache_middleware
 from .db.migrate import apply_migrations
 from .core import errors
 from .routers import (
@@ -43,7 +44,8 @@ def create_app(settings_override: Settings | None = None) -> FastAPI:
         title=settings.app_name, debug=settings.debug, version=settings.version
     )
 
-    # Middleware (request id / structured logging)
+    # Middleware (request-scoped caches; request id / structured logging)
+    app.middleware("http")(request_cache_middleware)
     app.middleware("http")(request_context_middleware)
 
     # Error handlers
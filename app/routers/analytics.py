@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.services.analytics_utils import (
     compute_average_daily_spend,
     compute_remaining_daily_budget,
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 class DailyTotal(BaseModel):
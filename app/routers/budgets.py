@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field
 from app.core.config import get_settings
 from app.models.budget import Budget
 from app.models.constants import CURRENCIES
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.services.trip_context import get_active_trip_id, clear_trip_context
 
 router = APIRouter(prefix="/budgets", tags=["budgets"])
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/budgets", tags=["budgets"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 class BudgetUpdateIn(BaseModel):
@@ -5,7 +5,7 @@ from typing import List, Optional
 from app.models.constants import CURRENCIES
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.models.expense import ExpenseIn, ExpenseOut, ExpenseUpdateIn
 from app.services.expense_validation import validate_expense_domain
 from app.services.rates.providers import (
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/expenses", tags=["expenses"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 def get_rate_service() -> CentralRateCacheService:
@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.services.forex_utils import card_status
 from app.services.settings import get_thresholds
 from app.services.trip_context import get_active_trip_id, clear_trip_context
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/forex-cards", tags=["forex"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 class ForexLoadIn(BaseModel):
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.models.timeline import TripDates
 
 router = APIRouter(prefix="/trips/{trip_id}/dates", tags=["timeline"])
@@ -9,7 +9,7 @@ router = APIRouter(prefix="/trips/{trip_id}/dates", tags=["timeline"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 @router.get("/", response_model=TripDates, summary="Get configured trip dates for a trip")
@@ -6,7 +6,7 @@ import json
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.models.trip import (
     TripCreate,
     TripUpdate,
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/trips", tags=["trips"])
 
 def get_db() -> Database:
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 def _row_to_trip(row: dict) -> TripOut:
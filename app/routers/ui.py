@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
 
 from fastapi import APIRouter, Depends, Request, Form, HTTPException, status
@@ -8,7 +8,7 @@ from fastapi.templating import Jinja2Templates
 from pydantic import ValidationError
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 from app.services.timeline import get_trip_dates, resolve_phase
 from app.services.budget_utils import list_budget_statuses
 from app.services.forex_utils import list_status as list_forex_status
@@ -57,20 +57,40 @@ templates = Jinja2Templates(directory="app/templates")
 
 def get_db():  # lightweight for MVP; could be shared dependency
     settings = get_settings()
-    return Database(settings.db_path)
+    return get_database(settings.db_path)
 
 
 def compute_phase(db: Database):
     trip_dates = get_trip_dates(db)
     if trip_dates:
-        phase = resolve_phase(date.today(), trip_dates)
+        phase = resolve_phase(
+            date.today().toordinal(), trip_dates["start_date"].toordinal()
+        )
     else:
         phase = "trip"  # default semantics
     return phase
 
 
+# (db_path, trip_id) -> (trips_version, nav context); entries go stale as soon
+# as the DAL bumps the trips version after a write.
+_NAV_CACHE: Dict[Tuple[str, int], Tuple[int, Dict[str, Any]]] = {}
+
+
 def _trip_nav_context(db: Database, trip_id: Optional[int] = None) -> Dict[str, Any]:
     tid = trip_id if trip_id is not None else get_active_trip_id(db)
+    key = (str(db.db_path), tid)
+    # Read the version before querying so a concurrent write can only make
+    # the stored entry look stale, never fresh.
+    version = db.trips_version()
+    cached = _NAV_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return dict(cached[1])
+    nav = _build_trip_nav_context(db, tid)
+    _NAV_CACHE[key] = (version, nav)
+    return dict(nav)
+
+
+def _build_trip_nav_context(db: Database, tid: int) -> Dict[str, Any]:
     trip_rows = db.list_trips(include_archived=True)
     trips: List[Dict[str, Any]] = []
     for row in trip_rows:
@@ -87,11 +107,7 @@ def _trip_nav_context(db: Database, trip_id: Optional[int] = None) -> Dict[str,
 
     # Determine if Forex tab should be shown
     # Show forex tab only if trip has more than 1 currency OR has forex currencies (non-INR)
-    show_forex = False
-    trip_currencies = db.get_trip_currencies(tid)
-    forex_currencies = [c for c in trip_currencies if c != "INR"]
-    if len(forex_currencies) > 0:
-        show_forex = True
+    show_forex = db.has_forex_currencies(tid)
 
     return {
         "active_trip": active,
@@ -672,7 +688,8 @@ async def ui_home(request: Request, db: Database = Depends(get_db)):
     rates = []
     for cur in ("SGD", "MYR"):
         try:
-            rate = rate_service.get_rate(cur)
+            # Providers keep full precision; round only for display.
+            rate = round2(rate_service.get_rate(cur))
             rates.append({"currency": cur, "rate": rate})
         except Exception:
             rates.append({"currency": cur, "rate": "-"})
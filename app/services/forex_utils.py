@@ -6,7 +6,7 @@ Keeps logic centralized so routers / future alert aggregation can reuse.
 MVP threshold: low balance when remaining / loaded_amount < 0.20 (strictly below 20%).
 If loaded_amount is 0, low balance is False (card effectively unused yet).
 """
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 from app.models.forex import ForexCard
 
 # Retain constant for backward compatibility; dynamic threshold now retrieved
@@ -15,6 +15,21 @@ from app.models.forex import ForexCard
 LOW_BALANCE_THRESHOLD = 0.20
 
 
+def _threshold_fraction(forex_low_pct: int) -> float:
+    return (forex_low_pct / 100.0) if forex_low_pct else LOW_BALANCE_THRESHOLD
+
+
+def _status_figures(
+    loaded: float, spent: float, threshold_fraction: float
+) -> Tuple[float, float, bool]:
+    """Shared arithmetic core: (remaining, percent_remaining, low_balance)."""
+    remaining = max(loaded - spent, 0)
+    if loaded <= 0:
+        return remaining, 0.0, False
+    ratio = remaining / loaded
+    return remaining, round(ratio * 100, 2), ratio < threshold_fraction
+
+
 def card_status(card_row: Dict[str, Any], forex_low_pct: int) -> Dict[str, Any]:
     """Return enriched status for a forex card row.
 
@@ -26,17 +41,10 @@ def card_status(card_row: Dict[str, Any], forex_low_pct: int) -> Dict[str, Any]:
         loaded_amount=card_row["loaded_amount"],
         spent_amount=card_row["spent_amount"],
     )
-    remaining = card.remaining
     loaded = card.loaded_amount
-    if loaded <= 0:
-        percent_remaining = 0.0
-        low_balance = False
-    else:
-        percent_remaining = round(remaining / loaded * 100, 2)
-        threshold_fraction = (
-            (forex_low_pct / 100.0) if forex_low_pct else LOW_BALANCE_THRESHOLD
-        )
-        low_balance = (remaining / loaded) < threshold_fraction
+    remaining, percent_remaining, low_balance = _status_figures(
+        loaded, card.spent_amount, _threshold_fraction(forex_low_pct)
+    )
     return {
         "currency": card.currency,
         "loaded_amount": loaded,
@@ -60,4 +68,25 @@ def list_status(
         # Fall back to legacy constant (20%). Higher layers (alerts, UI) should
         # fetch dynamic threshold via settings service and pass explicitly.
         forex_low_pct = int(LOW_BALANCE_THRESHOLD * 100)
-    return [card_status(r, forex_low_pct) for r in rows]
+    # Batch path: skip per-row ForexCard validation (rows already come from the
+    # DAL) and resolve the threshold once for the whole list.
+    threshold_fraction = _threshold_fraction(forex_low_pct)
+    out: list[Dict[str, Any]] = []
+    for r in rows:
+        loaded = float(r["loaded_amount"])
+        spent = float(r["spent_amount"])
+        remaining, percent_remaining, low_balance = _status_figures(
+            loaded, spent, threshold_fraction
+        )
+        out.append(
+            {
+                "currency": r["currency"],
+                "loaded_amount": loaded,
+                "spent_amount": spent,
+                "remaining": remaining,
+                "percent_remaining": percent_remaining,
+                "low_balance": low_balance,
+                "low_threshold_pct": forex_low_pct,
+            }
+        )
+    return out
@@ -2,34 +2,50 @@ from __future__ import annotations
 
 """Lightweight HTTP client util with retry (T07.02).
 
-Uses stdlib urllib to avoid adding external deps beyond existing httpx (but we keep
-this separate and simple). Focus: GET JSON with limited retries.
+Uses a module-level httpx.Client (httpx is already a dependency) so repeated
+rate refreshes reuse pooled keep-alive connections instead of paying a fresh
+TCP+TLS handshake per call. Focus: GET JSON with limited retries.
 """
 import json
 import time
-import urllib.request
-import urllib.error
 from typing import Any, Dict, Optional
 
+import httpx
+
+try:  # optional faster parser; parses the raw bytes without a decode pass
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback when orjson missing
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode("utf-8"))
+
 
 class HttpError(Exception):
     pass
 
 
+# follow_redirects keeps the urllib.request behaviour this replaced.
+_CLIENT = httpx.Client(
+    timeout=5.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+)
+
+
 def get_json(
     url: str, *, timeout: float = 5.0, retries: int = 2, backoff: float = 0.5
 ) -> Dict[str, Any]:
     last_err: Optional[Exception] = None
     for attempt in range(retries + 1):
         try:
-            with urllib.request.urlopen(url, timeout=timeout) as resp:  # nosec B310
-                if resp.status >= 400:
-                    raise HttpError(f"HTTP {resp.status} for {url}")
-                data = resp.read()
-                return json.loads(data.decode("utf-8"))
+            resp = _CLIENT.get(url, timeout=timeout)
+            if resp.status_code >= 400:
+                raise HttpError(f"HTTP {resp.status_code} for {url}")
+            return _loads(resp.content)
         except (
-            urllib.error.URLError,
-            TimeoutError,
+            httpx.HTTPError,
             HttpError,
             ValueError,
         ) as e:  # ValueError for JSON decode
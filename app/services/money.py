@@ -6,7 +6,20 @@ rounding semantics.
 
 from __future__ import annotations
 from decimal import Decimal, ROUND_HALF_UP
+import math
+
+# Fast path bound: below this, value * 100 carries far less than _HALF_TOL of
+# float error, so plain float rounding agrees with the Decimal result.
+_FAST_MAX = 1e7
+_HALF_TOL = 1e-6
 
 
 def round2(value: float) -> float:
+    if 0 <= value < _FAST_MAX:
+        scaled = value * 100
+        frac = scaled - math.floor(scaled)
+        # Values sitting on (or within float noise of) a .xx5 boundary go
+        # through Decimal so HALF_UP matches the decimal repr, e.g. 1.005 -> 1.01.
+        if abs(frac - 0.5) > _HALF_TOL:
+            return math.floor(scaled + 0.5) / 100.0
     return float(Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
@@ -18,5 +18,10 @@ class RateProvider(ABC):
         raise NotImplementedError
 
 
+def norm_currency(code: str) -> str:
+    """Upper-case a currency code, skipping the allocation when already upper."""
+    return code if code.isupper() else code.upper()
+
+
 class SupportsCompute(Protocol):
     def compute_inr(self, amount: float, currency: str) -> float: ...
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import lru_cache
-from typing import Dict, Iterable, TYPE_CHECKING
+import heapq
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
 
 from app.core.config import get_settings
 from app.services.app_settings import (
@@ -14,7 +16,8 @@ from app.services.app_settings import (
 if TYPE_CHECKING:  # pragma: no cover
     from app.db.dal import Database
 from app.services.money import round2
-from .providers import make_rate_provider, RateServiceFacade
+from .base import norm_currency
+from .providers import get_shared_rate_provider
 
 """Central rate cache service (T07.03).
 
@@ -28,6 +31,8 @@ Design:
     - Exposes get_rate() and compute_inr() similar to RateServiceFacade so routers
       can depend on this service going forward.
     - If TTL expired -> refresh by asking underlying provider for each needed currency.
+    - The configured TTL is an upper bound: each currency's TTL shrinks below it
+      while its rate is moving (see VOLATILITY_TARGET) and recovers as it settles.
     - Missing currency falls back to 1.0 (INR) to keep MVP resilient.
 
 Why separate from provider-level caching?
@@ -41,19 +46,28 @@ Future (T07.04):
     extended to check override store before delegating.
 """
 
-SUPPORTED_QUOTES: Iterable[str] = ("SGD", "MYR")  # extend as needed
+SUPPORTED_QUOTES: Iterable[str] = frozenset(("SGD", "MYR"))  # extend as needed
 
+# Adaptive TTL: each currency's TTL is the configured TTL scaled by
+# VOLATILITY_TARGET / (EWMA of relative rate change per refresh), never above
+# the configured TTL and never below MIN_TTL_SECONDS (the setting's minimum).
+VOLATILITY_TARGET = 0.005
+VOLATILITY_ALPHA = 0.1
+MIN_TTL_SECONDS = 60.0
 
-@dataclass
+
+# Expiry deadlines are time.monotonic() seconds; wall-clock datetimes are only
+# derived when rendering (list_overrides).
+@dataclass(slots=True)
 class _CacheEntry:
     rate: float
-    fetched_at: datetime
+    expires_at: float
 
 
-@dataclass
+@dataclass(slots=True)
 class _OverrideEntry:
     rate: float
-    expires_at: datetime
+    expires_at: float
 
 
 class CentralRateCacheService:
@@ -62,6 +76,17 @@ class CentralRateCacheService:
     Public API mirrors RateServiceFacade to avoid broad refactors elsewhere.
     """
 
+    __slots__ = (
+        "_settings",
+        "_fetch_rate",
+        "_ttl_seconds",
+        "_cache",
+        "_refresh_locks",
+        "_overrides",
+        "_override_heap",
+        "_volatility",
+    )
+
     def __init__(self, db: "Database" | None = None):  # db optional for DI override
         self._settings = get_settings()
         # If DB provided, allow dynamic override of provider & TTL via metadata
@@ -71,68 +96,112 @@ class CentralRateCacheService:
         else:
             provider_name = self._settings.exchange_rate_provider
             ttl_seconds = self._settings.rates_cache_ttl_seconds
-        provider = make_rate_provider(provider_name)
-        # Reuse existing facade for compute logic (rounding rules).
-        self._underlying = RateServiceFacade(provider)
-        self._ttl = timedelta(seconds=ttl_seconds)
+        provider = get_shared_rate_provider(provider_name)
+        self._fetch_rate = provider.get_rate
+        self._ttl_seconds = float(ttl_seconds)
         self._cache: Dict[str, _CacheEntry] = {}
+        # Single-flight guard: one refresh per currency at a time. Only
+        # SUPPORTED_QUOTES are ever refreshed, so the locks are created upfront.
+        self._refresh_locks: Dict[str, threading.Lock] = {
+            c: threading.Lock() for c in SUPPORTED_QUOTES
+        }
         # Manual overrides (T07.04). Keyed by currency upper.
         self._overrides: Dict[str, _OverrideEntry] = {}
+        # Min-heap of (expires_at, currency) so purging only touches expired
+        # entries. Stale tuples (cleared / replaced overrides) are skipped.
+        self._override_heap: List[Tuple[float, str]] = []
+        # EWMA of |new - old| / old per currency; seeded at the target so the
+        # first TTLs match the configured value.
+        self._volatility: Dict[str, float] = {}
 
     # Internal --------------------------------------------------
     def _is_entry_valid(self, entry: _CacheEntry) -> bool:
-        return datetime.utcnow() - entry.fetched_at < self._ttl
+        return entry.expires_at > time.monotonic()
+
+    def _entry_ttl(self, currency: str, old_rate: float | None, new_rate: float) -> float:
+        vol = self._volatility.get(currency, VOLATILITY_TARGET)
+        if old_rate:
+            change = abs(new_rate - old_rate) / old_rate
+            vol = (1 - VOLATILITY_ALPHA) * vol + VOLATILITY_ALPHA * change
+            self._volatility[currency] = vol
+        if vol <= VOLATILITY_TARGET:
+            return self._ttl_seconds
+        ttl = self._ttl_seconds * (VOLATILITY_TARGET / vol)
+        return max(ttl, min(MIN_TTL_SECONDS, self._ttl_seconds))
 
     def _refresh_currency(self, currency: str) -> float:
-        rate = self._underlying.get_rate(currency)
-        self._cache[currency] = _CacheEntry(rate=rate, fetched_at=datetime.utcnow())
+        rate = self._fetch_rate(currency)
+        previous = self._cache.get(currency)
+        ttl = self._entry_ttl(currency, previous.rate if previous else None, rate)
+        self._cache[currency] = _CacheEntry(
+            rate=rate, expires_at=time.monotonic() + ttl
+        )
         return rate
 
     def _get_cached_or_refresh(self, currency: str) -> float:
-        currency = currency.upper()
+        # currency already normalized by get_rate
         entry = self._cache.get(currency)
         if entry and self._is_entry_valid(entry):
             return entry.rate
         # Only refresh supported quotes; anything else (e.g., INR) trivial
         if currency in SUPPORTED_QUOTES:
-            return self._refresh_currency(currency)
+            with self._refresh_locks[currency]:
+                # Another thread may have refreshed while we waited.
+                entry = self._cache.get(currency)
+                if entry and self._is_entry_valid(entry):
+                    return entry.rate
+                return self._refresh_currency(currency)
         # For base / unsupported pass-through (INR or others default 1.0)
         return 1.0
 
     # Public API -----------------------------------------------
     def _purge_expired_overrides(self) -> None:
-        now = datetime.utcnow()
-        expired = [k for k, v in self._overrides.items() if v.expires_at <= now]
-        for k in expired:
-            self._overrides.pop(k, None)
+        heap = self._override_heap
+        if not heap:
+            return
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            expires_at, currency = heapq.heappop(heap)
+            entry = self._overrides.get(currency)
+            if entry is not None and entry.expires_at == expires_at:
+                del self._overrides[currency]
 
     # Manual override API (T07.04) -----------------------------
     def set_override(self, currency: str, rate: float, ttl_seconds: int) -> None:
-        currency = currency.upper()
+        currency = norm_currency(currency)
         if rate <= 0:
             raise ValueError("override rate must be positive")
         if ttl_seconds <= 0:
             raise ValueError("override ttl must be positive seconds")
-        self._overrides[currency] = _OverrideEntry(
-            rate=rate, expires_at=datetime.utcnow() + timedelta(seconds=ttl_seconds)
-        )
+        expires_at = time.monotonic() + ttl_seconds
+        self._overrides[currency] = _OverrideEntry(rate=rate, expires_at=expires_at)
+        heapq.heappush(self._override_heap, (expires_at, currency))
 
     def clear_override(self, currency: str) -> bool:
-        currency = currency.upper()
+        currency = norm_currency(currency)
         return self._overrides.pop(currency, None) is not None
 
     def list_overrides(self) -> Dict[str, Dict[str, str | float]]:
         self._purge_expired_overrides()
+        # Translate monotonic deadlines to wall-clock only for display.
+        now_wall = datetime.utcnow()
+        now_mono = time.monotonic()
         return {
-            c: {"rate": v.rate, "expires_at": v.expires_at.isoformat()}
+            c: {
+                "rate": v.rate,
+                "expires_at": (
+                    now_wall + timedelta(seconds=v.expires_at - now_mono)
+                ).isoformat(),
+            }
             for c, v in self._overrides.items()
         }
 
     def get_rate(self, currency: str) -> float:
-        if currency.upper() == "INR":
+        currency = norm_currency(currency)
+        if currency == "INR":
             return 1.0
         self._purge_expired_overrides()
-        ov = self._overrides.get(currency.upper())
+        ov = self._overrides.get(currency)
         if ov:
             return ov.rate
         return self._get_cached_or_refresh(currency)
@@ -142,14 +211,22 @@ class CentralRateCacheService:
         return round2(amount * rate)
 
 
-# Singleton dependency helper used by FastAPI DI
-@lru_cache
+# Singleton dependency helper used by FastAPI DI. A plain module global is
+# cheaper than lru_cache on this per-request path; a racing double init is
+# harmless because construction has no side effects.
+_INSTANCE: CentralRateCacheService | None = None
+
+
 def get_central_rate_cache_service() -> CentralRateCacheService:  # legacy no-DB path
-    return CentralRateCacheService()
+    global _INSTANCE
+    inst = _INSTANCE
+    if inst is None:
+        _INSTANCE = inst = CentralRateCacheService()
+    return inst
 
 
 def build_dynamic_rate_cache_service(db: "Database") -> CentralRateCacheService:
-    """Factory that bypasses lru_cache so dynamic metadata changes apply immediately.
+    """Factory that bypasses the singleton so dynamic metadata changes apply immediately.
 
     Use this in contexts (settings update, admin panel) where immediate reflection
     of provider/TTL changes is desired without process restart. Regular routes can
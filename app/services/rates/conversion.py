@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from app.services.money import round2
+from .base import norm_currency
 
 """INR equivalent conversion utility (T07.05).
 
@@ -22,7 +23,7 @@ class SupportsRateLookup(Protocol):
     def get_rate(self, currency: str) -> float: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversionResult:
     original_amount: float
     currency: str
@@ -33,7 +34,7 @@ class ConversionResult:
 def compute_inr_equivalent(
     amount: float, currency: str, rate_service: SupportsRateLookup
 ) -> ConversionResult:
-    currency = currency.upper()
+    currency = norm_currency(currency)
     if currency == "INR":
         rate = 1.0
         inr_equiv = round2(amount)
@@ -5,9 +5,11 @@ from __future__ import annotations
 'ExternalPlaceholderRateProvider' stands in for a future HTTP-based provider; it simply
 returns slightly different constants so we can demonstrate a switch.
 """
-from typing import Dict, Optional
+import threading
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
-from .base import RateProvider
+
+from .base import RateProvider, norm_currency
 from app.services.money import round2
 from app.services.http_client import get_json, HttpError
 
@@ -27,12 +29,12 @@ _EXTERNAL_PLACEHOLDER_RATES: Dict[str, float] = {
 
 class StaticRateProvider(RateProvider):
     def get_rate(self, quote_currency: str) -> float:  # type: ignore[override]
-        return _STATIC_RATES.get(quote_currency.upper(), 1.0)
+        return _STATIC_RATES.get(norm_currency(quote_currency), 1.0)
 
 
 class ExternalPlaceholderRateProvider(RateProvider):
     def get_rate(self, quote_currency: str) -> float:  # type: ignore[override]
-        return _EXTERNAL_PLACEHOLDER_RATES.get(quote_currency.upper(), 1.0)
+        return _EXTERNAL_PLACEHOLDER_RATES.get(norm_currency(quote_currency), 1.0)
 
 
 _PROVIDER_REGISTRY = {
@@ -50,6 +52,23 @@ def make_rate_provider(kind: str) -> RateProvider:
     return cls()
 
 
+# Shared provider instances keyed by kind, so rebuilding a cache service (e.g.
+# after a settings change) keeps the provider's warm in-memory rates.
+_PROVIDER_INSTANCES: Dict[str, RateProvider] = {}
+_PROVIDER_INSTANCES_LOCK = threading.Lock()
+
+
+def get_shared_rate_provider(kind: str) -> RateProvider:
+    provider = _PROVIDER_INSTANCES.get(kind)
+    if provider is not None:
+        return provider
+    with _PROVIDER_INSTANCES_LOCK:
+        provider = _PROVIDER_INSTANCES.get(kind)
+        if provider is None:
+            provider = _PROVIDER_INSTANCES[kind] = make_rate_provider(kind)
+        return provider
+
+
 class RateServiceFacade:
     """Thin facade maintaining old RateService compute_inr API for routers.
 
@@ -72,39 +91,52 @@ class RateServiceFacade:
 # We fetch latest base=INR and keep rates for SGD/MYR. Minimal in-memory cache.
 class ExternalHTTPRateProvider(RateProvider):
     _CACHE_TTL = timedelta(minutes=30)
+    _RETRY_AFTER_FAILURE = timedelta(minutes=5)
+    # Live rates survive failed refreshes for this long before reverting to static.
+    _STALE_GRACE = timedelta(hours=24)
+    _URL = "https://api.exchangerate.host/latest?base=INR&symbols=SGD,MYR,INR"
 
     def __init__(self):
         self._cache_expires: Optional[datetime] = None
-        self._rates: Dict[str, float] = {}
+        self._last_success: Optional[datetime] = None
+        # Static placeholders are the baseline; live values overwrite per key.
+        self._rates: Dict[str, float] = dict(_STATIC_RATES)
+
+    def _is_fresh(self, now: datetime) -> bool:
+        return self._cache_expires is not None and now < self._cache_expires
+
+    def _apply_payload(self, data: Dict[str, Any], now: datetime) -> None:
+        rates = data.get("rates") or {}
+        # The API returns quote in target currency per base unit; we need INR per unit of quote.
+        # Since base=INR, rates[SGD] = SGD per INR. We invert to get INR per 1 SGD.
+        # Keep full precision; rounding happens once at the INR amount boundary.
+        # Symbols missing from the response keep their previous value.
+        for qc in ("SGD", "MYR"):
+            v = rates.get(qc)
+            if v and v > 0:
+                self._rates[qc] = 1.0 / v
+        self._last_success = now
+        self._cache_expires = now + self._CACHE_TTL
+
+    def _apply_failure(self, now: datetime) -> None:
+        # Keep the last live rates through short outages; degrade to static
+        # once they are older than the grace period.
+        if self._last_success is None or now - self._last_success > self._STALE_GRACE:
+            self._rates = dict(_STATIC_RATES)
+        self._cache_expires = now + self._RETRY_AFTER_FAILURE
 
     def _refresh_if_needed(self) -> None:
         now = datetime.utcnow()
-        if self._cache_expires and now < self._cache_expires:
+        if self._is_fresh(now):
             return
-        url = "https://api.exchangerate.host/latest?base=INR&symbols=SGD,MYR,INR"
         try:
-            data = get_json(url, timeout=5.0, retries=2)
-            rates = data.get("rates") or {}
-            # The API returns quote in target currency per base unit; we need INR per unit of quote.
-            # Since base=INR, rates[SGD] = SGD per INR. We invert to get INR per 1 SGD.
-            new_rates: Dict[str, float] = {"INR": 1.0}
-            for qc in ("SGD", "MYR"):
-                v = rates.get(qc)
-                if v and v > 0:
-                    new_rates[qc] = round2(1 / v)
-            # Fallback to static placeholders if missing
-            for qc, val in _STATIC_RATES.items():
-                new_rates.setdefault(qc, val)
-            self._rates = new_rates
-            self._cache_expires = now + self._CACHE_TTL
+            self._apply_payload(get_json(self._URL, timeout=5.0, retries=2), now)
         except HttpError:
-            # On failure we degrade gracefully to static
-            self._rates = dict(_STATIC_RATES)
-            self._cache_expires = now + timedelta(minutes=5)
+            self._apply_failure(now)
 
     def get_rate(self, quote_currency: str) -> float:  # type: ignore[override]
         self._refresh_if_needed()
-        return self._rates.get(quote_currency.upper(), 1.0)
+        return self._rates.get(norm_currency(quote_currency), 1.0)
 
 
 # Register external-http after class definition
@@ -35,15 +35,43 @@ TRIP_META_PREFIXES: Iterable[str] = (
     "trip_end_date",
 )
 
+# Transactional tables cleared per trip / on full wipe. Exchange rates are
+# global and only dropped on a full wipe.
+_TRIP_SCOPED_DELETES = tuple(
+    f"DELETE FROM {table} WHERE trip_id = ?"
+    for table in ("expenses", "budgets", "forex_cards")
+)
+_WIPE_ALL_DELETES = tuple(
+    f"DELETE FROM {table}"
+    for table in ("expenses", "budgets", "forex_cards", "exchange_rates", "trips")
+)
+
+
+# Entries ending in "_" are prefixes; the rest must match exactly.
+_PRESERVE_EXACT = frozenset(p for p in PRESERVE_META_PREFIXES if not p.endswith("_"))
+_PRESERVE_PREFIXES = tuple(p for p in PRESERVE_META_PREFIXES if p.endswith("_"))
+
 
 def _should_preserve(key: str) -> bool:
-    for p in PRESERVE_META_PREFIXES:
-        if p.endswith("_"):
-            if key.startswith(p):
-                return True
-        elif key == p:
-            return True
-    return False
+    return key in _PRESERVE_EXACT or key.startswith(_PRESERVE_PREFIXES)
+
+
+def _glob_prefix(prefix: str) -> str:
+    # GLOB (unlike LIKE) is case-sensitive, matching str.startswith.
+    escaped = "".join(f"[{ch}]" if ch in "*?[" else ch for ch in prefix)
+    return escaped + "*"
+
+
+# Server-side equivalent of _should_preserve: delete every metadata row that
+# is neither an exact preserved key nor under a preserved prefix.
+_DELETE_UNPRESERVED_META_SQL = "DELETE FROM metadata WHERE key NOT IN ({}){}".format(
+    ",".join("?" * len(_PRESERVE_EXACT)),
+    " AND key NOT GLOB ?" * len(_PRESERVE_PREFIXES),
+)
+_DELETE_UNPRESERVED_META_PARAMS = (
+    *sorted(_PRESERVE_EXACT),
+    *(_glob_prefix(p) for p in _PRESERVE_PREFIXES),
+)
 
 
 def reset_trip_data(
@@ -64,14 +92,18 @@ def reset_trip_data(
     wipe_all: bool
         When True, remove data for every trip (legacy behaviour).
     """
+    if not wipe_all and trip_id is None:
+        trip_id = get_active_trip_id(db)
     with db._connect() as conn:  # type: ignore[attr-defined]
+        # One explicit transaction for the whole reset -> a single commit.
+        conn.execute("BEGIN")
         cur = conn.cursor()
         if wipe_all:
             _wipe_all(cur, preserve_settings)
         else:
-            target_trip = trip_id if trip_id is not None else get_active_trip_id(db)
-            _reset_single_trip(cur, target_trip)
+            _reset_single_trip(cur, trip_id)
         conn.commit()
+    db._bump_trips_version()  # type: ignore[attr-defined]
 
 
 def _reset_single_trip(cur, trip_id: int) -> None:
@@ -79,9 +111,8 @@ def _reset_single_trip(cur, trip_id: int) -> None:
     cur.execute("SELECT 1 FROM trips WHERE id = ?", (trip_id,))
     if not cur.fetchone():
         raise ValueError("Trip not found")
-    cur.execute("DELETE FROM expenses WHERE trip_id = ?", (trip_id,))
-    cur.execute("DELETE FROM budgets WHERE trip_id = ?", (trip_id,))
-    cur.execute("DELETE FROM forex_cards WHERE trip_id = ?", (trip_id,))
+    for sql in _TRIP_SCOPED_DELETES:
+        cur.execute(sql, (trip_id,))
     # Exchange rates are global; leave untouched.
     cur.execute(
         f"""
@@ -97,14 +128,9 @@ def _reset_single_trip(cur, trip_id: int) -> None:
 
 def _wipe_all(cur, preserve_settings: bool) -> None:
     """Remove all trip data, emulating legacy behaviour."""
-    # Clear transactional tables
-    cur.execute("DELETE FROM expenses")
-    cur.execute("DELETE FROM budgets")
-    cur.execute("DELETE FROM forex_cards")
-    cur.execute("DELETE FROM exchange_rates")
-
-    # Reset trips table
-    cur.execute("DELETE FROM trips")
+    # Clear transactional tables and trips
+    for sql in _WIPE_ALL_DELETES:
+        cur.execute(sql)
     cur.execute(
         f"""
         INSERT INTO trips (name, status, created_at, updated_at)
@@ -113,23 +139,11 @@ def _wipe_all(cur, preserve_settings: bool) -> None:
     )
     default_trip_id = int(cur.lastrowid)
 
-    # Handle metadata
-    cur.execute("SELECT key,value FROM metadata")
-    rows = cur.fetchall()
-    keep = []
+    # Handle metadata: preserved settings stay in place, everything else goes.
     if preserve_settings:
-        keep = [(r["key"], r["value"]) for r in rows if _should_preserve(r["key"])]
-    cur.execute("DELETE FROM metadata")
-    for k, v in keep:
-        cur.execute(
-            f"""
-            INSERT INTO metadata(key,value)
-            VALUES(?,?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value,
-                updated_at=({UTC_NOW_SQL})
-            """,
-            (k, v),
-        )
+        cur.execute(_DELETE_UNPRESERVED_META_SQL, _DELETE_UNPRESERVED_META_PARAMS)
+    else:
+        cur.execute("DELETE FROM metadata")
     cur.execute(
         f"""
         INSERT INTO metadata(key,value)
@@ -9,9 +9,12 @@ All values constrained: 1..99 and warn < danger.
 """
 
 from __future__ import annotations
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 from app.db.dal import Database
+from app.services.trip_context import get_request_metadata
 
 DEFAULT_BUDGET_WARN = 80
 DEFAULT_BUDGET_DANGER = 90
@@ -24,6 +27,13 @@ META_KEYS = {
 }
 
 
+_UPSERT_META_SQL = (
+    "INSERT INTO metadata(key,value) VALUES(?,?) "
+    "ON CONFLICT(key) DO UPDATE SET value=excluded.value, "
+    "updated_at=(strftime('%Y-%m-%dT%H:%M:%fZ','now'))"
+)
+
+
 @dataclass
 class Thresholds:
     budget_warn: int
@@ -38,34 +48,44 @@ class Thresholds:
         }
 
 
-def _get_metadata_map(db: Database) -> Dict[str, str]:  # lightweight helper
-    with db._connect() as conn:  # type: ignore[attr-defined]
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT key, value FROM metadata WHERE key IN (?,?,?)",
-            tuple(META_KEYS.keys()),
-        )
-        return {r[0]: r[1] for r in cur.fetchall()}
+# Request-scoped memo of the parsed thresholds, keyed by DB path so a process
+# talking to several databases (tests, scripts) never mixes their values.
+thresholds_ctx: ContextVar[Optional[Tuple[Path, Thresholds]]] = ContextVar(
+    "settings_thresholds", default=None
+)
 
 
-def get_thresholds(db: Database) -> Thresholds:
-    data = _get_metadata_map(db)
+def _clamp_pct(value: object, default: int) -> int:
+    """Parse a stored percentage and clamp it to 1..99; unparsable -> default."""
+    if isinstance(value, int):
+        n = value
+    elif isinstance(value, str) and (
+        value.isdecimal() or (value[:1] == "-" and value[1:].isdecimal())
+    ):
+        n = int(value)
+    else:
+        return default
+    return 1 if n < 1 else 99 if n > 99 else n
 
-    def _int_or_default(k: str) -> int:
-        try:
-            return max(1, min(99, int(data.get(k, META_KEYS[k]))))
-        except Exception:  # pragma: no cover
-            return META_KEYS[k]
 
-    warn = _int_or_default("budget_warn_pct")
-    danger = _int_or_default("budget_danger_pct")
-    forex_low = _int_or_default("forex_low_pct")
+def get_thresholds(db: Database) -> Thresholds:
+    cached = thresholds_ctx.get()
+    if cached is not None and cached[0] == db.db_path:
+        return cached[1]
+    # Shares the active-trip bootstrap round-trip (see trip_context).
+    data = get_request_metadata(db)
+
+    warn = _clamp_pct(data.get("budget_warn_pct"), META_KEYS["budget_warn_pct"])
+    danger = _clamp_pct(data.get("budget_danger_pct"), META_KEYS["budget_danger_pct"])
+    forex_low = _clamp_pct(data.get("forex_low_pct"), META_KEYS["forex_low_pct"])
     # Enforce invariants; if invalid stored values, fall back gracefully
     if not (1 <= warn < danger <= 100):
         warn, danger = DEFAULT_BUDGET_WARN, DEFAULT_BUDGET_DANGER
     if not (1 <= forex_low < 100):
         forex_low = DEFAULT_FOREX_LOW
-    return Thresholds(warn, danger, forex_low)
+    thresholds = Thresholds(warn, danger, forex_low)
+    thresholds_ctx.set((db.db_path, thresholds))
+    return thresholds
 
 
 def set_thresholds(
@@ -78,25 +98,25 @@ def set_thresholds(
         raise ValueError("Invalid forex low threshold: 1..99")
     with db._connect() as conn:  # type: ignore[attr-defined]
         cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO metadata(key,value) VALUES('budget_warn_pct',?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=(strftime('%Y-%m-%dT%H:%M:%fZ','now'))",
-            (str(budget_warn),),
-        )
-        cur.execute(
-            "INSERT INTO metadata(key,value) VALUES('budget_danger_pct',?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=(strftime('%Y-%m-%dT%H:%M:%fZ','now'))",
-            (str(budget_danger),),
-        )
-        cur.execute(
-            "INSERT INTO metadata(key,value) VALUES('forex_low_pct',?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=(strftime('%Y-%m-%dT%H:%M:%fZ','now'))",
-            (str(forex_low),),
+        # One statement, one transaction: all three keys commit together.
+        cur.executemany(
+            _UPSERT_META_SQL,
+            (
+                ("budget_warn_pct", str(budget_warn)),
+                ("budget_danger_pct", str(budget_danger)),
+                ("forex_low_pct", str(forex_low)),
+            ),
         )
-    return Thresholds(budget_warn, budget_danger, forex_low)
+    thresholds = Thresholds(budget_warn, budget_danger, forex_low)
+    thresholds_ctx.set((db.db_path, thresholds))
+    return thresholds
 
 
 __all__ = [
     "Thresholds",
     "get_thresholds",
     "set_thresholds",
+    "thresholds_ctx",
     "DEFAULT_BUDGET_WARN",
     "DEFAULT_BUDGET_DANGER",
     "DEFAULT_FOREX_LOW",
@@ -1,33 +1,23 @@
 from __future__ import annotations
-from datetime import date
 from typing import Literal, Optional
 from app.db.dal import Database
-from app.core.config import get_settings
-from app.services.trip_context import get_active_trip_id
+from app.services.trip_context import get_active_trip_id, get_request_db
 
 Phase = Literal["pre-trip", "trip"]
 
 
-def _get_db() -> Database:
-    settings = get_settings()
-    return Database(settings.db_path)
-
-
 def get_trip_dates(db: Optional[Database] = None):
-    db = db or _get_db()
-    trip_id = get_active_trip_id(db)
-    return db.get_trip_dates(trip_id=trip_id)
+    db = db or get_request_db()
+    return db.get_trip_dates(trip_id=get_active_trip_id(db))
 
 
-def resolve_phase(d: date, trip_dates: Optional[dict] = None) -> Phase:
-    """Return 'pre-trip' if date is strictly before start_date, else 'trip'.
+def resolve_phase(d_ord: int, start_ord: Optional[int] = None) -> Phase:
+    """Return 'pre-trip' if the day ordinal is strictly before the start ordinal, else 'trip'.
 
-    If trip dates not yet configured, treat all as 'trip' (simpler for MVP).
+    Both arguments are ``date.toordinal()`` values so callers can convert the
+    trip start once and classify many dates with a plain int compare.
+    If trip dates not yet configured (start_ord None), treat all as 'trip'.
     """
-    if trip_dates is None:
+    if start_ord is None or d_ord >= start_ord:
         return "trip"
-    start = trip_dates["start_date"]
-    # end date isn't needed yet for classification but may be used later for post-trip logic
-    if d < start:
-        return "pre-trip"
-    return "trip"
+    return "pre-trip"
@@ -7,22 +7,46 @@ context while still delegating persistence duties to the data layer.
 from __future__ import annotations
 
 from contextvars import ContextVar
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from app.core.config import get_settings
-from app.db.dal import Database
+from app.db.dal import Database, get_database
 
 _trip_id_ctx: ContextVar[Optional[int]] = ContextVar("trip_ctx_trip_id", default=None)
-_trip_ctx: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
-    "trip_ctx_trip_record", default=None
+# Metadata map fetched alongside the active trip id, keyed by DB path.
+_meta_ctx: ContextVar[Optional[Tuple[Path, Dict[str, str]]]] = ContextVar(
+    "trip_ctx_metadata", default=None
 )
 
+# Metadata keys fetched with the active trip id: the thresholds read by
+# services.settings.get_thresholds on most page renders.
+REQUEST_METADATA_KEYS: Tuple[str, ...] = (
+    "budget_warn_pct",
+    "budget_danger_pct",
+    "forex_low_pct",
+)
+
+
+def get_request_db() -> Database:
+    """Return the shared Database handle for the configured path."""
+    return get_database(get_settings().db_path)
+
 
 def _get_db(db: Optional[Database]) -> Database:
     if db is not None:
         return db
-    settings = get_settings()
-    return Database(settings.db_path)
+    return get_request_db()
+
+
+def _bootstrap(database: Database) -> Dict[str, str]:
+    """Warm the trip id and metadata caches together from one DB round-trip."""
+    data = database.get_request_bootstrap(REQUEST_METADATA_KEYS)
+    metadata = data["metadata"]
+    _meta_ctx.set((database.db_path, metadata))
+    if data["trip_id"] is not None:
+        _trip_id_ctx.set(data["trip_id"])
+    return metadata
 
 
 def get_active_trip_id(db: Optional[Database] = None) -> int:
@@ -30,39 +54,41 @@ def get_active_trip_id(db: Optional[Database] = None) -> int:
     if cached is not None:
         return cached
     database = _get_db(db)
-    trip_id = database.get_active_trip_id()
-    _trip_id_ctx.set(trip_id)
+    _bootstrap(database)
+    trip_id = _trip_id_ctx.get()
+    if trip_id is None:
+        # No trips at all: let the DAL raise its usual error.
+        trip_id = database.get_active_trip_id()
+        _trip_id_ctx.set(trip_id)
     return trip_id
 
 
-def get_active_trip(db: Optional[Database] = None) -> Dict[str, Any]:
-    cached = _trip_ctx.get()
-    if cached is not None:
-        return cached
+def get_request_metadata(db: Optional[Database] = None) -> Dict[str, str]:
+    """Return the request metadata map (REQUEST_METADATA_KEYS), cached per request."""
     database = _get_db(db)
-    trip = database.get_active_trip()
-    if trip is None:
-        raise RuntimeError("No active trip configured")
-    _trip_ctx.set(trip)
-    _trip_id_ctx.set(int(trip["id"]))
-    return trip
+    cached = _meta_ctx.get()
+    if cached is not None and cached[0] == database.db_path:
+        return cached[1]
+    return _bootstrap(database)
 
 
 def set_active_trip(trip_id: int, db: Optional[Database] = None) -> None:
     database = _get_db(db)
     database.set_active_trip(trip_id)
+    _meta_ctx.set(None)
     _trip_id_ctx.set(trip_id)
-    _trip_ctx.set(database.get_trip(trip_id))
 
 
 def clear_trip_context() -> None:
     _trip_id_ctx.set(None)
-    _trip_ctx.set(None)
+    _meta_ctx.set(None)
 
 
 __all__ = [
     "get_active_trip_id",
-    "get_active_trip",
+    "REQUEST_METADATA_KEYS",
+    "get_request_db",
+    "get_request_metadata",
     "set_active_trip",
     "clear_trip_context",
 ]
@@ -1,5 +1,6 @@
 import subprocess
 import sys
+import tempfile
 
 
 def run_git_command(command_list):
@@ -13,10 +14,56 @@ def run_git_command(command_list):
     return result.stdout.strip()
 
 
+def iter_git_records(command_list, chunk_size=65536):
+    """Stream NUL-terminated records from a git command (e.g. `git log -z`).
+
+    Records are decoded and yielded as they arrive instead of buffering the
+    whole output first; exits like run_git_command on failure.
+    """
+    # stderr goes to a temp file: a pipe nobody drains until stdout hits EOF
+    # could fill up and deadlock git.
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(command_list, stdout=subprocess.PIPE, stderr=err)
+        finished = False
+        try:
+            pending = b""
+            for chunk in iter(lambda: proc.stdout.read(chunk_size), b""):
+                *records, pending = (pending + chunk).split(b"\x00")
+                for record in records:
+                    if record:
+                        yield record.decode("utf-8", errors="replace")
+            if pending:
+                yield pending.decode("utf-8", errors="replace")
+            finished = True
+        finally:
+            # Consumer stopped early (or raised): don't leave git running.
+            if not finished:
+                proc.kill()
+            proc.stdout.close()
+            returncode = proc.wait()
+        if returncode != 0:
+            err.seek(0)
+            stderr = err.read().decode(errors="replace").strip()
+            print(
+                f"❌ Git command failed:\n  {' '.join(command_list)}\n  Error: {stderr}"
+            )
+            sys.exit(1)
+
+
 def get_last_two_tags():
     """Fetch the last two tags sorted by commit date."""
     run_git_command(["git", "fetch", "--tags", "--quiet"])
-    tags = run_git_command(["git", "tag", "--sort=-creatordate"]).splitlines()
+    # Let git stop after the two newest tags instead of listing every tag.
+    tags = run_git_command(
+        [
+            "git",
+            "for-each-ref",
+            "refs/tags",
+            "--sort=-creatordate",
+            "--count=2",
+            "--format=%(refname:short)",
+        ]
+    ).splitlines()
     if len(tags) < 2:
         print("❌ Not enough tags found to generate changelog.")
         sys.exit(1)
@@ -26,16 +73,21 @@ def get_last_two_tags():
 def get_commits_between_tags(old_tag, new_tag):
     """Get commit messages between two tags."""
     print(f"🔍 Checking commits between {old_tag} → {new_tag}")
-    commits_output = run_git_command(
+    # NUL-terminated records with unit-separated fields: subjects may contain
+    # any printable character without confusing the parser.
+    log_format = "%h%x1f%s%x1f%an"
+    commits = []
+    for record in iter_git_records(
         [
             "git",
             "log",
             f"{old_tag}..{new_tag}",
-            "--oneline",
-            "--pretty=format:%h %s (%an)",
+            "-z",
+            f"--pretty=format:{log_format}",
         ]
-    )
-    commits = commits_output.splitlines()
+    ):
+        short_hash, subject, author = record.split("\x1f", 2)
+        commits.append(f"{short_hash} {subject} ({author})")
     if not commits:
         print(f"⚠️ No commits found between {old_tag} and {new_tag}.")
     return commits
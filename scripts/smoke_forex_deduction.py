@@ -1,88 +1,90 @@
+import asyncio
 import os
 import tempfile
 import json
 from datetime import date
-from fastapi.testclient import TestClient
+
+import httpx
 from app.main import create_app
 from app.core.config import Settings
-from app.models.expense import ExpenseIn
 
 
-def run():
+async def run():
     with tempfile.TemporaryDirectory() as d:
         settings = Settings(db_path=os.path.join(d, "test.db"))
         app = create_app(settings_override=settings)
-        client = TestClient(app)
-        # Direct Database handle not required for this smoke test; using API routes
-
-        # 1. Load forex card (SGD)
-        client.put("/forex-cards/SGD", json={"loaded_amount": 1000})
-
-        # 2. Create forex expense SGD 200
-        e1 = ExpenseIn(
-            amount=200,
-            currency="SGD",
-            category="other",
-            description=None,
-            date=date.today(),
-            payment_method="forex",
-        )
-        client.post("/expenses/", json=json.loads(e1.json()))
+        # Drive the ASGI app in-process over one pooled async client so
+        # independent calls can overlap.
+        transport = httpx.ASGITransport(app=app)
+        # TestClient followed redirects; keep that so "/expenses" -> "/expenses/" works.
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver", follow_redirects=True
+        ) as client:
+            # Direct Database handle not required for this smoke test; using API routes
 
-        # 3. Create non-forex expense SGD 50 (cash) -> should NOT affect forex spent
-        e2 = ExpenseIn(
-            amount=50,
-            currency="SGD",
-            category="other",
-            description=None,
-            date=date.today(),
-            payment_method="cash",
-        )
-        client.post("/expenses/", json=json.loads(e2.json()))
+            tpl = {
+                "currency": "SGD",
+                "category": "other",
+                "description": None,
+                "date": date.today().isoformat(),
+            }
+            e1 = {**tpl, "amount": 200, "payment_method": "forex"}
+            e2 = {**tpl, "amount": 50, "payment_method": "cash"}
+            e3 = {**tpl, "amount": 80, "payment_method": "cash"}
 
-        # 4. Patch first expense from 200 -> 250 (forex) delta +50
-        # fetch list, find id of forex expense
-        expenses = client.get("/expenses").json()
-        forex_exp = next(
-            e
-            for e in expenses
-            if e["payment_method"] == "forex" and e["currency"] == "SGD"
-        )
-        client.patch(f"/expenses/{forex_exp['id']}", json={"amount": 250})
+            # Independent setup, issued concurrently:
+            # 1. Load forex card (SGD)
+            # 2. Create forex expense SGD 200
+            # 3. Create non-forex expense SGD 50 (cash) -> should NOT affect forex spent
+            # 6a. Create new cash expense SGD 80 (patched to forex below)
+            _, e1_resp, _, e3_resp = await asyncio.gather(
+                client.put("/forex-cards/SGD", json={"loaded_amount": 1000}),
+                client.post("/expenses/", json=e1),
+                client.post("/expenses/", json=e2),
+                client.post("/expenses/", json=e3),
+            )
+            # Use the created ids: listing expenses to find the forex one would
+            # race with the concurrent e3 -> forex patch below.
+            e1_id = e1_resp.json()["id"]
+            e3_id = e3_resp.json()["id"]
 
-        # 5. Patch forex -> cash (should subtract 250 from forex spent)
-        client.patch(f"/expenses/{forex_exp['id']}", json={"payment_method": "cash"})
+            async def patch_forex_expense():
+                # 4. Patch first expense from 200 -> 250 (forex) delta +50
+                await client.patch(f"/expenses/{e1_id}", json={"amount": 250})
+                # 5. Patch forex -> cash (should subtract 250 from forex spent)
+                await client.patch(f"/expenses/{e1_id}", json={"payment_method": "cash"})
 
-        # 6. Create new cash expense then patch to forex 80 (adds 80)
-        e3 = ExpenseIn(
-            amount=80,
-            currency="SGD",
-            category="other",
-            description=None,
-            date=date.today(),
-            payment_method="cash",
-        )
-        resp = client.post("/expenses/", json=json.loads(e3.json()))
-        e3_id = resp.json()["id"]
-        client.patch(f"/expenses/{e3_id}", json={"payment_method": "forex"})
+            async def patch_then_delete_e3():
+                # 6b. Patch cash expense to forex 80 (adds 80)
+                await client.patch(f"/expenses/{e3_id}", json={"payment_method": "forex"})
+                # 7. Delete the patched (now forex 80) -> subtract 80
+                await client.delete(f"/expenses/{e3_id}")
 
-        # 7. Delete the patched (now forex 80) -> subtract 80
-        client.delete(f"/expenses/{e3_id}")
+            # The two edit chains touch different expenses; only steps within a
+            # chain depend on each other.
+            await asyncio.gather(patch_forex_expense(), patch_then_delete_e3())
 
-        # Inspect final forex card state
-        forex_cards = client.get("/forex-cards/").json()
-        sgd_card = next(c for c in forex_cards if c["currency"] == "SGD")
+            # Inspect final forex card state
+            forex_cards, all_expenses = await asyncio.gather(
+                client.get("/forex-cards/"), client.get("/expenses")
+            )
+            sgd_card = next(c for c in forex_cards.json() if c["currency"] == "SGD")
 
-        print(
-            json.dumps(
-                {
-                    "sgd_card_final": sgd_card,
-                    "all_expenses": client.get("/expenses").json(),
-                },
-                indent=2,
+            print(
+                json.dumps(
+                    {
+                        "sgd_card_final": sgd_card,
+                        "all_expenses": all_expenses.json(),
+                    },
+                    indent=2,
+                )
             )
-        )
+
+            # Every forex movement above is reversed (e1 moved to cash, e3 deleted),
+            # so the card ends where it was loaded with nothing spent.
+            assert sgd_card["loaded_amount"] == 1000, sgd_card
+            assert sgd_card["spent_amount"] == 0, sgd_card
 
 
 if __name__ == "__main__":
-    run()
+    asyncio.run(run())
@@ -5,7 +5,6 @@ from datetime import date
 from fastapi.testclient import TestClient
 from app.main import create_app
 from app.core.config import Settings
-from app.models.expense import ExpenseIn
 
 """Smoke test for T06.04 low balance flag.
 Scenario:
@@ -24,25 +23,21 @@ def run():
 
         client.put("/forex-cards/SGD", json={"loaded_amount": 1000})
 
-        def make_exp(amount):
-            return ExpenseIn(
-                amount=amount,
-                currency="SGD",
-                category="other",
-                description=None,
-                date=date.today(),
-                payment_method="forex",
-            )
+        # Payload template built once; each post only swaps the amount.
+        tpl = {
+            "currency": "SGD",
+            "category": "other",
+            "description": None,
+            "date": date.today().isoformat(),
+            "payment_method": "forex",
+        }
 
         # Spend 700
-        e1 = make_exp(500)
-        client.post("/expenses/", json=json.loads(e1.json()))
-        e2 = make_exp(200)
-        client.post("/expenses/", json=json.loads(e2.json()))
+        client.post("/expenses/", json={**tpl, "amount": 500})
+        client.post("/expenses/", json={**tpl, "amount": 200})
 
         # Spend 110 (cross below 20%)
-        e3 = make_exp(110)
-        resp = client.post("/expenses/", json=json.loads(e3.json()))
+        resp = client.post("/expenses/", json={**tpl, "amount": 110})
         e3_id = resp.json()["id"]
 
         def card():
@@ -2,52 +2,52 @@
 
 Demonstrates:
  1. First access triggers underlying provider fetch.
- 2. Subsequent access within TTL uses cached rates (no visible change, but we show timestamps).
- 3. Manual TTL shortening simulation: we directly mutate internal _cache timestamps to force refresh.
+ 2. Subsequent access within TTL uses cached rates (no visible change, but we show seconds left).
+ 3. Manual TTL shortening simulation: we directly mutate internal _cache expiry deadlines to force refresh.
 
 NOTE: This is a lightweight diagnostic and not a formal test.
 """
 
-from datetime import datetime, timedelta
+import time
 from pprint import pprint
 
 from app.services.rates.cache_service import get_central_rate_cache_service
 
 
-def run():
-    svc = get_central_rate_cache_service()
-    out = {"initial": {}, "second": {}, "forced_refresh": {}}
-
-    # Initial fetch
-    for c in ("SGD", "MYR"):
-        rate = svc.get_rate(c)
-        out["initial"][c] = {
-            "rate": rate,
-            "fetched_at": svc._cache[c].fetched_at.isoformat(),  # type: ignore[attr-defined]
-        }
+def remaining(entry) -> float:
+    # expires_at is a time.monotonic() deadline; only the distance is meaningful.
+    return entry.expires_at - time.monotonic()
 
-    # Second fetch (should reuse timestamps)
-    for c in ("SGD", "MYR"):
-        rate = svc.get_rate(c)
-        out["second"][c] = {
-            "rate": rate,
-            "fetched_at": svc._cache[c].fetched_at.isoformat(),  # type: ignore[attr-defined]
-        }
 
-    # Force refresh by backdating fetched_at beyond TTL
-    for entry in svc._cache.values():  # type: ignore[attr-defined]
-        entry.fetched_at = datetime.utcnow() - timedelta(
-            seconds=svc._ttl.total_seconds() + 5
-        )  # type: ignore[attr-defined]
-
-    for c in ("SGD", "MYR"):
-        rate = svc.get_rate(c)
-        out["forced_refresh"][c] = {
-            "rate": rate,
-            "fetched_at": svc._cache[c].fetched_at.isoformat(),  # type: ignore[attr-defined]
+def run():
+    svc = get_central_rate_cache_service()
+    cache = svc._cache  # type: ignore[attr-defined]
+    currencies = ("SGD", "MYR")
+    # Raw (rate, seconds until expiry) per stage; shaped into dicts at print time.
+    stages = {"initial": {}, "second": {}, "forced_refresh": {}}
+
+    # Initial fetch, then an immediate second fetch (should reuse expiry deadlines)
+    for c in currencies:
+        stages["initial"][c] = (svc.get_rate(c), remaining(cache[c]))
+        stages["second"][c] = (svc.get_rate(c), remaining(cache[c]))
+
+    # Force refresh by moving expires_at into the past
+    past = time.monotonic() - 5
+    for entry in cache.values():
+        entry.expires_at = past
+
+    for c in currencies:
+        stages["forced_refresh"][c] = (svc.get_rate(c), remaining(cache[c]))
+
+    pprint(
+        {
+            stage: {
+                c: {"rate": rate, "expires_in_s": round(expires_in, 1)}
+                for c, (rate, expires_in) in snaps.items()
+            }
+            for stage, snaps in stages.items()
         }
-
-    pprint(out)
+    )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,14 @@
+import asyncio
 from datetime import date
 import os
 import sys
-import sqlite3
 import tempfile
 
 # Establish isolated temp directory and set env BEFORE importing settings
 TEMP_DIR = tempfile.mkdtemp(prefix="phase_test_")
 os.environ["DATA_DIR"] = TEMP_DIR
-os.environ["DB_FILENAME"] = "test.sqlite3"
+# Throwaway data: keep the whole database in RAM (shared across connections).
+os.environ["DB_PATH"] = "file:phase_filter_test?mode=memory&cache=shared"
 
 # Ensure project root on path when executed directly
 ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -15,18 +16,18 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from fastapi.testclient import TestClient
-from app.main import create_app
-from app.db.schema import init_db
-from app.core.config import Settings
-from app.db.dal import Database
+from app.main import app
+from app.routers.expenses import list_expenses_endpoint
+from app.core.config import get_settings
+from app.db.dal import get_database
 from app.models.expense import ExpenseIn
 
-# Create fresh Settings instance (not cached) and init DB
-settings = Settings()
-settings.init_post_load()
-init_db(settings.db_path)
+# Env is set above, so importing app.main already built the app (and applied
+# migrations) against the temp DB; reuse its cached settings and app instance
+# instead of re-reading env/.env and wiring a second app.
+settings = get_settings()
 
-db = Database(settings.db_path)
+db = get_database(settings.db_path)
 
 # Seed trip dates
 trip_start = date(2025, 9, 1)
@@ -40,37 +41,54 @@ entries = [
     (date(2025, 9, 1), 300),  # trip start
     (date(2025, 9, 2), 400),  # trip
 ]
-for d, amt in entries:
-    e = ExpenseIn(
-        amount=amt,
-        currency="INR",
-        category="other",
-        description=None,
-        date=d,
-        payment_method="cash",
-    )
-    db.insert_expense_with_budget(e, amt, 1.0)
+# Validate the shared fields once, then stamp out per-row copies: copy()
+# does not re-run validators, and the DAL still does the budget bookkeeping.
+template = ExpenseIn(
+    amount=entries[0][1],
+    currency="INR",
+    category="other",
+    description=None,
+    date=entries[0][0],
+    payment_method="cash",
+)
+db.insert_expenses_with_budget_bulk(
+    [
+        (template.copy(update={"amount": float(amt), "date": d}), amt, 1.0)
+        for d, amt in entries
+    ]
+)
 
-app = create_app(settings_override=settings)
 client = TestClient(app)
 
+
+def list_phase(phase):
+    """Run the /expenses handler in-process: same phase logic, no JSON round-trip."""
+    return asyncio.run(
+        list_expenses_endpoint(
+            start_date=None,
+            end_date=None,
+            currency=None,
+            phase=phase,
+            trip_id=None,
+            db=db,
+        )
+    )
+
+
+# One call over the wire keeps the HTTP path covered; the rest go direct.
 all_resp = client.get("/expenses").json()
-pre_resp = client.get("/expenses", params={"phase": "pre-trip"}).json()
-trip_resp = client.get("/expenses", params={"phase": "trip"}).json()
+pre_resp = list_phase("pre-trip")
+trip_resp = list_phase("trip")
 
 print("ALL count", len(all_resp))
-print("PRE count", len(pre_resp), "dates", sorted({e["date"] for e in pre_resp}))
-print("TRIP count", len(trip_resp), "dates", sorted({e["date"] for e in trip_resp}))
+print("PRE count", len(pre_resp), "dates", db.distinct_expense_dates("pre-trip"))
+print("TRIP count", len(trip_resp), "dates", db.distinct_expense_dates("trip"))
 
 # Remove trip dates to exercise option A semantics
-conn = sqlite3.connect(settings.db_path)
-cur = conn.cursor()
-cur.execute("DELETE FROM metadata WHERE key in ('trip_start_date','trip_end_date')")
-conn.commit()
-conn.close()
-
-pre_no = client.get("/expenses", params={"phase": "pre-trip"}).json()
-trip_no = client.get("/expenses", params={"phase": "trip"}).json()
+db.clear_trip_dates()
+
+pre_no = list_phase("pre-trip")
+trip_no = list_phase("trip")
 print("NO DATES pre-trip count (expect 0):", len(pre_no))
 print("NO DATES trip count (expect ALL):", len(trip_no))
 
@@ -0,0 +1,54 @@
+import os
+import sys
+from decimal import Decimal, ROUND_HALF_UP
+
+# Ensure project root on path when executed directly
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.services.money import round2, _FAST_MAX
+
+
+def reference(value):
+    """The pre-fast-path implementation: Decimal HALF_UP on the repr."""
+    return float(Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+# Exact .xx5 halves, including classic float traps (1.005 is 1.00499... in binary)
+halves = [0.005, 0.015, 0.125, 1.005, 2.675, 10.005, 1234.565, 99999.995]
+for v in halves:
+    assert round2(v) == reference(v), f"half {v}: {round2(v)} != {reference(v)}"
+assert round2(1.005) == 1.01
+assert round2(2.675) == 2.68
+
+# Around the fast-path bound: below, at and above _FAST_MAX
+near_max = [
+    _FAST_MAX - 0.005,
+    _FAST_MAX - 0.004,
+    _FAST_MAX - 0.006,
+    _FAST_MAX,
+    _FAST_MAX + 0.005,
+    _FAST_MAX * 10 + 0.125,
+]
+for v in near_max:
+    assert round2(v) == reference(v), f"near max {v}: {round2(v)} != {reference(v)}"
+
+# Negatives always take the Decimal path (HALF_UP rounds away from zero)
+negatives = [-0.005, -1.005, -2.675, -0.004, -1234.5651]
+for v in negatives:
+    assert round2(v) == reference(v), f"negative {v}: {round2(v)} != {reference(v)}"
+assert round2(-1.005) == -1.01
+
+# Decimal fallback values and ordinary fast-path values agree with the reference
+ordinary = [0.0, 0.01, 0.014, 0.016, 62.0 * 3.3333, 199.999, 123456.789, 1e12 + 0.015]
+for v in ordinary:
+    assert round2(v) == reference(v), f"value {v}: {round2(v)} != {reference(v)}"
+
+# Dense sweep over cent boundaries in the fast-path range
+for cents in range(0, 200000, 7):
+    for tail in (0.4, 0.5, 0.6):
+        v = (cents + tail) / 100
+        assert round2(v) == reference(v), f"sweep {v}: {round2(v)} != {reference(v)}"
+
+print("round2 boundary test: PASS")
@@ -1,6 +1,8 @@
 """Quick test script to verify currency migration works."""
 
+import hashlib
 from pathlib import Path
+from app.db import schema
 from app.db.migrate import apply_migrations
 from app.db.dal import Database
 from app.routers.ui import _trip_nav_context
@@ -11,6 +13,29 @@ print(f"Applying migrations to {db_path}...")
 version = apply_migrations(db_path)
 print(f"✓ Migrated to schema version {version}")
 
+# 0. Schema DDL must not change without a SCHEMA_VERSION bump: databases already
+# at the current version skip the CREATE TABLE/INDEX suite in init_schema.
+# After bumping SCHEMA_VERSION for a DDL change, update both values here.
+PINNED_SCHEMA_VERSION = 3
+PINNED_SCHEMA_DIGEST = "dc05846b710cdcf7cf4a5d592979821965a5ef294f7c857ed30a9ae8fa4bffbb"
+print("\n0. Testing schema version pin:")
+digest = hashlib.sha256(
+    "\n".join((*schema.DDL_ORDER, *schema.INDEX_DDL_ORDER)).encode()
+).hexdigest()
+if digest != PINNED_SCHEMA_DIGEST:
+    assert schema.SCHEMA_VERSION != PINNED_SCHEMA_VERSION, (
+        "Schema DDL/indexes changed but SCHEMA_VERSION was not bumped; "
+        "existing databases would never receive the change"
+    )
+    raise AssertionError(
+        f"SCHEMA_VERSION bumped to {schema.SCHEMA_VERSION}; update "
+        f"PINNED_SCHEMA_VERSION and PINNED_SCHEMA_DIGEST (now {digest})"
+    )
+assert schema.SCHEMA_VERSION == PINNED_SCHEMA_VERSION, (
+    f"SCHEMA_VERSION is {schema.SCHEMA_VERSION}; update PINNED_SCHEMA_VERSION to match"
+)
+print("   ✓ Schema DDL matches SCHEMA_VERSION")
+
 # Test the database
 db = Database(db_path)
 
@@ -25,10 +50,11 @@ print("   ✓ Default currencies working")
 # 2. Check existing trips have currencies
 print("\n2. Testing existing trips have currencies:")
 trips = db.list_trips(include_archived=True)
+all_currencies = db.get_all_trip_currencies()
 for trip in trips:
     trip_id = trip["id"]
     trip_name = trip["name"]
-    currencies = db.get_trip_currencies(trip_id)
+    currencies = all_currencies[trip_id]
     print(f"   Trip '{trip_name}' (ID {trip_id}): {currencies}")
     assert isinstance(currencies, list), f"Trip {trip_id} currencies should be a list"
     assert len(currencies) > 0, f"Trip {trip_id} should have at least one currency"
@@ -44,16 +70,14 @@ print("   ✓ Forex currencies working")
 # 4. Test setting default currencies
 print("\n4. Testing set default currencies:")
 test_currencies = ["USD", "EUR", "GBP"]
-db.set_default_currencies(test_currencies)
-retrieved = db.get_default_currencies()
+original = db.swap_default_currencies(test_currencies)
+# Restore original defaults; the swap hands back what was just set
+retrieved = db.swap_default_currencies(original)
 print(f"   Set to: {test_currencies}")
 print(f"   Retrieved: {retrieved}")
 assert retrieved == test_currencies, "Retrieved currencies should match what was set"
 print("   ✓ Set/get default currencies working")
-
-# Restore original defaults
-db.set_default_currencies(["INR", "SGD", "MYR"])
-print("   Restored original default currencies")
+print(f"   Restored original default currencies: {original}")
 
 # 5. Check that show_forex_tab logic works
 print("\n5. Testing show forex tab logic:")
@@ -61,7 +85,8 @@ nav_context = _trip_nav_context(db, trip_id=active_trip_id)
 show_forex = nav_context.get("show_forex_tab", False)
 print(f"   Show forex tab for active trip: {show_forex}")
 print(f"   (Based on forex currencies: {forex_currencies})")
-expected = len(forex_currencies) > 0
+expected = db.has_forex_currencies(active_trip_id)
+assert expected == (len(forex_currencies) > 0), "has_forex_currencies should match the list"
 assert show_forex == expected, f"Show forex tab should be {expected}"
 print("   ✓ Show forex tab logic working")
 